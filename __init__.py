@@ -1,9 +1,15 @@
 import asyncio
-import json
+import codecs
 import logging
+import os
+import re
 import socket
-from datetime import datetime
-from typing import Optional, Dict, Any, Tuple
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+import orjson
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -11,14 +17,94 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import (
-    DOMAIN, PLATFORMS, MODBUS_DEVICE_ADDR, MODBUS_FUNCTION_CODE, 
-    MODBUS_DATA_LENGTH, MODBUS_EXPECTED_LENGTH, OFFLINE_THRESHOLD, 
+    DOMAIN, EVENT_TOPIC, PLATFORMS, MODBUS_DEVICE_ADDR, MODBUS_FUNCTION_CODE, 
+    MODBUS_DATA_LENGTH, MODBUS_EXPECTED_LENGTH, MODBUS_CRC_POLYNOMIAL, OFFLINE_THRESHOLD, 
     HEARTBEAT_INDICATORS, REGISTRATION_INDICATORS, WIND_SPEED_SCALE, 
-    WIND_DIRECTION_SCALE
+    WIND_DIRECTION_SCALE, UDP_RECV_BATCH_SIZE, UDP_MAX_DATAGRAM_SIZE, UDP_MAX_RECEIVE_SOCKETS,
+    MAX_KNOWN_CLIENTS, WIND_DATA_LOG_INTERVAL
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# 事件数据模板，按固定键顺序预建，触发事件时复制后填充
+_WIND_EVENT_TEMPLATE = {
+    'event_type': 'wind_data_received',
+    'wind_data': None,
+    'timestamp': None,
+    'source_addr': None
+}
+_HEARTBEAT_EVENT_TEMPLATE = {
+    'event_type': 'device_heartbeat',
+    'device_addr': None,
+    'heartbeat_data': None,
+    'timestamp': None
+}
+_REGISTRATION_EVENT_TEMPLATE = {
+    'event_type': 'device_registered',
+    'device_addr': None,
+    'registration_data': None,
+    'timestamp': None
+}
+
+# 换算系数的倒数，仅用于日志输出（以乘法代替除法；按 %.1f 输出，不影响显示结果）
+_INV_WIND_SPEED_SCALE = 1.0 / WIND_SPEED_SCALE
+_INV_WIND_DIRECTION_SCALE = 1.0 / WIND_DIRECTION_SCALE
+
+# JSON 数据包中风力数据字段的字符串键到整数字段编号的映射 (0=风速, 1=风级, 2=风向角度, 3=风向编码)
+_WIND_FIELD_KEYS = {str(field): field for field in range(4)}
+
+# UTF-8 解码失败时依次尝试的编解码器 (导入时查找并缓存；GB2312 是 GBK 的子集)
+_FALLBACK_DECODERS = tuple(codecs.lookup(name).decode for name in ('gbk',))
+
+# 文本数据包指示符 (导入时统一转为小写字节串)
+_HEARTBEAT_BYTES = tuple(i.lower().encode() for i in HEARTBEAT_INDICATORS)
+_REGISTRATION_BYTES = tuple(i.lower().encode() for i in REGISTRATION_INDICATORS)
+
+def _minimal_indicators(indicators: Tuple[bytes, ...]) -> Tuple[bytes, ...]:
+    """去除包含同类其他指示符的冗余项（如 keep-alive 已被 alive 覆盖），匹配结果不变"""
+    return tuple(
+        i for i in indicators
+        if not any(other != i and other in i for other in indicators)
+    )
+
+# 文本数据包指示符匹配模式 (预编译，单次扫描完成匹配；字节模式下忽略大小写仅作用于ASCII)
+_HEARTBEAT_PATTERN = re.compile(
+    b'|'.join(map(re.escape, _minimal_indicators(_HEARTBEAT_BYTES))), re.IGNORECASE
+)
+# 联合模式命中的心跳指示符集合，用于 O(1) 判断命中项的类别
+_HEARTBEAT_MATCHES = frozenset(_minimal_indicators(_HEARTBEAT_BYTES))
+# 全部指示符的联合模式，用于一次扫描快速排除非文本数据包（心跳指示符在前，同位置优先命中）
+_TEXT_INDICATOR_PATTERN = re.compile(
+    b'|'.join(map(re.escape, _minimal_indicators(_HEARTBEAT_BYTES) + _minimal_indicators(_REGISTRATION_BYTES))),
+    re.IGNORECASE
+)
+
+# ModBus RTU 帧结构: 设备地址 + 功能码 + 数据长度 + 4个大端序寄存器 + CRC(低字节在前)
+_MODBUS_FRAME = struct.Struct('>3B4H2B')
+
+def _build_crc16_table() -> Tuple[int, ...]:
+    """生成 CRC16-Modbus 查找表"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ MODBUS_CRC_POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+_CRC16_TABLE = _build_crc16_table()
+
+def _crc16_modbus(data: Union[bytes, memoryview], length: int) -> int:
+    """计算前 length 字节的 CRC16-Modbus 校验值（查表法，每字节一次查表）"""
+    crc = 0xFFFF
+    table = _CRC16_TABLE
+    for i in range(length):
+        crc = (crc >> 8) ^ table[(crc ^ data[i]) & 0xFF]
+    return crc
+
 # ================== 入口点函数 ==================
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -40,14 +126,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # 检查并清理已存在的实例
         await _cleanup_existing_instance(hass, entry_id, port)
         
-        # 检查端口可用性
-        _LOGGER.debug(f"检查端口 {port} 可用性...")
-        if not await _check_port_available(port):
-            _LOGGER.error(f"端口 {port} 被占用，无法启动服务")
-            raise ConfigEntryNotReady(f"端口 {port} 不可用")
-        _LOGGER.debug(f"端口 {port} 检查通过")
-        
-        # 创建并启动UDP服务器
+        # 创建并启动UDP服务器（直接绑定端口，端口被占用时由 start() 重试并抛出 ConfigEntryNotReady）
         udp_server = UDPWindServer(hass, port)
         await udp_server.start()
         
@@ -118,61 +197,36 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def _cleanup_existing_instance(hass: HomeAssistant, entry_id: str, port: int) -> None:
     """清理已存在的实例"""
     try:
+        domain_data = hass.data.get(DOMAIN)
+        if not domain_data:
+            return
+        
         # 检查是否有相同entry_id的实例
-        existing_data = hass.data.get(DOMAIN, {}).get(entry_id)
+        existing_data = domain_data.get(entry_id)
         if existing_data:
             _LOGGER.warning(f"发现已存在的实例 (entry_id: {entry_id})，正在清理...")
             existing_server = existing_data.get("server")
             if existing_server:
                 await existing_server.stop()
-            hass.data[DOMAIN].pop(entry_id, None)
+            domain_data.pop(entry_id, None)
             _LOGGER.info("已清理旧实例")
+            if not domain_data:
+                return
         
-        # 检查是否有相同端口的实例
-        for existing_entry_id, data in list(hass.data.get(DOMAIN, {}).items()):
-            if data.get("port") == port and existing_entry_id != entry_id:
-                _LOGGER.warning(f"发现端口 {port} 被其他实例占用 (entry_id: {existing_entry_id})，正在清理...")
-                existing_server = data.get("server")
-                if existing_server:
-                    await existing_server.stop()
-                hass.data[DOMAIN].pop(existing_entry_id, None)
-                _LOGGER.info(f"已清理端口冲突的实例: {existing_entry_id}")
-                
+        # 检查是否有相同端口的实例（只收集冲突项，清理时字典会被修改）
+        conflicts = [(existing_entry_id, data) for existing_entry_id, data in domain_data.items()
+                     if data.get("port") == port and existing_entry_id != entry_id]
+        for existing_entry_id, data in conflicts:
+            _LOGGER.warning(f"发现端口 {port} 被其他实例占用 (entry_id: {existing_entry_id})，正在清理...")
+            existing_server = data.get("server")
+            if existing_server:
+                await existing_server.stop()
+            domain_data.pop(existing_entry_id, None)
+            _LOGGER.info(f"已清理端口冲突的实例: {existing_entry_id}")
+            
     except Exception as e:
         _LOGGER.error(f"清理已存在实例时出错: {e}")
 
-async def _check_port_available(port: int) -> bool:
-    """检查端口是否可用"""
-    sock = None
-    try:
-        # 尝试绑定UDP端口
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
-        # 尝试设置 SO_REUSEPORT（如果可用）
-        try:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-        except (AttributeError, OSError):
-            # SO_REUSEPORT 在某些系统上不可用，忽略
-            pass
-        
-        sock.bind(('0.0.0.0', port))
-        _LOGGER.debug(f"端口 {port} 可用")
-        return True
-        
-    except OSError as e:
-        _LOGGER.debug(f"端口 {port} 不可用: {e}")
-        return False
-    except Exception as e:
-        _LOGGER.error(f"检查端口可用性时出错: {e}")
-        return False
-    finally:
-        if sock:
-            try:
-                sock.close()
-            except:
-                pass
-
 async def _cleanup_failed_setup(hass: HomeAssistant, entry_id: str) -> None:
     """清理失败的设置过程中创建的资源"""
     try:
@@ -181,7 +235,7 @@ async def _cleanup_failed_setup(hass: HomeAssistant, entry_id: str) -> None:
             if server_data and "server" in server_data:
                 await server_data["server"].stop()
             hass.data[DOMAIN].pop(entry_id, None)
-            _LOGGER.debug(f"已清理失败设置的资源: {entry_id}")
+            _LOGGER.debug("已清理失败设置的资源: %s", entry_id)
     except Exception as e:
         _LOGGER.error(f"清理失败设置资源时出错: {e}")
 
@@ -213,7 +267,7 @@ async def _register_services(hass: HomeAssistant, udp_server: 'UDPWindServer') -
                 'persistent_notification', 'create',
                 {'message': message, 'title': 'Wind UDP Receiver 设备状态'}
             )
-            _LOGGER.debug(f"设备状态查询结果: {len(all_status)} 个端口")
+            _LOGGER.debug("设备状态查询结果: %d 个端口", len(all_status))
         except Exception as e:
             _LOGGER.error(f"获取设备状态失败: {e}")
     
@@ -241,11 +295,14 @@ def _format_device_status_message(all_status: Dict[str, Dict[str, Any]]) -> str:
 class UDPWindServer:
     """UDP风力传感器服务器 - 增强版本，支持优雅重启"""
     
-    def __init__(self, hass: HomeAssistant, port: int):
+    __slots__ = ('hass', 'port', 'transports', 'protocol', '_workers', '_running', '_start_lock')
+    
+    def __init__(self, hass: HomeAssistant, port: int, workers: Optional[int] = None):
         self.hass = hass
         self.port = port
-        self.transport = None
+        self.transports: List[Any] = []
         self.protocol = None
+        self._workers = workers or min(os.cpu_count() or 1, UDP_MAX_RECEIVE_SOCKETS)
         self._running = False
         self._start_lock = asyncio.Lock()
         
@@ -260,47 +317,35 @@ class UDPWindServer:
             retry_delay = 1.0
             
             for attempt in range(max_retries):
-                sock = None
+                sockets: List[socket.socket] = []
                 try:
-                    _LOGGER.debug(f"尝试启动UDP服务器，端口: {self.port} (尝试 {attempt + 1}/{max_retries})")
+                    _LOGGER.debug("尝试启动UDP服务器，端口: %s (尝试 %d/%d)", self.port, attempt + 1, max_retries)
                     
-                    # 创建UDP套接字并设置重用选项
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                    # 创建UDP套接字；支持 SO_REUSEPORT 时绑定多个套接字，由内核在各接收队列间分发数据包
+                    sock, reuse_port = self._create_socket()
+                    sockets.append(sock)
+                    if reuse_port:
+                        for _ in range(self._workers - 1):
+                            sockets.append(self._create_socket()[0])
                     
-                    # 在某些系统上需要设置 SO_REUSEPORT
-                    try:
-                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-                    except (AttributeError, OSError):
-                        # SO_REUSEPORT 在某些系统上不可用，忽略
-                        pass
-                    
-                    # 绑定到指定端口
-                    sock.bind(('0.0.0.0', self.port))
-                    
-                    # 使用预先配置的套接字创建数据报端点
-                    loop = asyncio.get_event_loop()
-                    self.transport, self.protocol = await loop.create_datagram_endpoint(
-                        lambda: UDPProtocol(self.hass),
-                        sock=sock
-                    )
+                    # 所有套接字共用同一个协议处理器，客户端状态统一维护
+                    loop = asyncio.get_running_loop()
+                    self.protocol = UDPProtocol(self.hass, loop)
+                    for sock in sockets:
+                        self.transports.append(await self._create_transport(loop, sock, self.protocol))
                     
                     self._running = True
-                    _LOGGER.info(f"UDP服务器已启动，监听端口: {self.port}")
+                    _LOGGER.info(f"UDP服务器已启动，监听端口: {self.port} (接收套接字: {len(sockets)})")
                     return
                     
                 except OSError as e:
-                    if sock:
-                        try:
-                            sock.close()
-                        except:
-                            pass
+                    self._abort_start(sockets)
                     
                     error_msg = str(e).lower()
                     if any(msg in error_msg for msg in ["address already in use", "only one usage", "permission denied"]):
                         _LOGGER.warning(f"端口 {self.port} 启动失败: {e} (尝试 {attempt + 1}/{max_retries})")
                         if attempt < max_retries - 1:
-                            _LOGGER.debug(f"等待 {retry_delay} 秒后重试...")
+                            _LOGGER.debug("等待 %s 秒后重试...", retry_delay)
                             await asyncio.sleep(retry_delay)
                             retry_delay *= 2  # 指数退避
                         else:
@@ -309,16 +354,62 @@ class UDPWindServer:
                         _LOGGER.error(f"UDP服务器启动失败 (非端口问题): {e}")
                         raise
                 except Exception as e:
-                    if sock:
-                        try:
-                            sock.close()
-                        except:
-                            pass
+                    self._abort_start(sockets)
                     _LOGGER.error(f"启动UDP服务器失败: {e}")
                     if attempt == max_retries - 1:
                         raise ConfigEntryNotReady(f"UDP服务器启动失败: {e}")
-                    _LOGGER.debug(f"等待 {retry_delay} 秒后重试...")
+                    _LOGGER.debug("等待 %s 秒后重试...", retry_delay)
                     await asyncio.sleep(retry_delay)
+    
+    def _create_socket(self) -> Tuple[socket.socket, bool]:
+        """创建并绑定UDP套接字，返回套接字及是否已启用 SO_REUSEPORT"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            
+            # 在某些系统上需要设置 SO_REUSEPORT
+            reuse_port = True
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except (AttributeError, OSError):
+                # SO_REUSEPORT 在某些系统上不可用，只使用单个套接字
+                reuse_port = False
+            
+            # 绑定到指定端口
+            sock.bind(('0.0.0.0', self.port))
+        except Exception:
+            sock.close()
+            raise
+        return sock, reuse_port
+    
+    def _abort_start(self, sockets: List[socket.socket]) -> None:
+        """启动失败时关闭已创建的传输和套接字"""
+        for transport in self.transports:
+            try:
+                transport.close()
+            except Exception:
+                pass
+        self.transports = []
+        self.protocol = None
+        
+        for sock in sockets:
+            try:
+                sock.close()
+            except Exception:
+                pass
+    
+    async def _create_transport(self, loop: asyncio.AbstractEventLoop, sock: socket.socket,
+                                protocol: 'UDPProtocol') -> Any:
+        """创建数据报传输，优先使用批量读取"""
+        reader = DatagramBatchReader(loop, sock, protocol)
+        try:
+            reader.start()
+            return reader
+        except NotImplementedError:
+            # 事件循环不支持 add_reader（如 Windows Proactor），回退到标准数据报端点
+            _LOGGER.debug("事件循环不支持批量读取，使用标准数据报端点")
+            transport, _ = await loop.create_datagram_endpoint(lambda: protocol, sock=sock)
+            return transport
         
     async def stop(self) -> None:
         """停止UDP服务器，确保完全清理"""
@@ -328,38 +419,26 @@ class UDPWindServer:
                 return
                 
             try:
-                if self.transport:
+                if self.transports:
                     _LOGGER.debug("正在关闭UDP传输...")
-                    self.transport.close()
+                    for transport in self.transports:
+                        transport.close()
                     
-                    # 等待传输完全关闭
-                    max_wait = 5.0  # 最多等待5秒
-                    wait_time = 0.1
-                    total_waited = 0
-                    
-                    while not self.transport.is_closing() and total_waited < max_wait:
-                        await asyncio.sleep(wait_time)
-                        total_waited += wait_time
-                    
-                    if total_waited >= max_wait:
-                        _LOGGER.warning("UDP传输关闭超时")
-                    else:
-                        _LOGGER.debug(f"UDP传输已关闭 (等待时间: {total_waited:.2f}s)")
+                    # 批量读取器同步关闭套接字；标准数据报传输在下一次循环迭代中关闭，让出一次即可
+                    await asyncio.sleep(0)
+                    _LOGGER.debug("UDP传输已关闭")
                 
-                self.transport = None
+                self.transports = []
                 self.protocol = None
                 self._running = False
                 
-                # 额外等待，确保端口释放
-                await asyncio.sleep(0.5)
-                
                 _LOGGER.info(f"UDP服务器已停止，端口 {self.port} 已释放")
                 
             except Exception as e:
                 _LOGGER.error(f"停止UDP服务器时出错: {e}")
                 # 即使出错也要标记为已停止
                 self._running = False
-                self.transport = None
+                self.transports = []
                 self.protocol = None
     
     def get_client_status(self) -> Dict[str, Any]:
@@ -371,187 +450,281 @@ class UDPWindServer:
     @property
     def is_running(self) -> bool:
         """检查服务器是否正在运行"""
-        return self._running and self.transport is not None
+        return self._running and bool(self.transports)
+
+class DatagramBatchReader:
+    """UDP批量读取器 - 每次可读事件一次性读取多个数据包"""
+    
+    __slots__ = ('_loop', '_sock', '_protocol', '_closing', '_buffer', '_view')
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, sock: socket.socket,
+                 protocol: asyncio.DatagramProtocol):
+        self._loop = loop
+        self._sock = sock
+        self._protocol = protocol
+        self._closing = False
+        # 预分配的接收缓冲区，所有数据包复用同一块内存
+        self._buffer = bytearray(UDP_MAX_DATAGRAM_SIZE)
+        self._view = memoryview(self._buffer)
+    
+    def start(self) -> None:
+        """注册套接字读取回调"""
+        self._sock.setblocking(False)
+        self._loop.add_reader(self._sock.fileno(), self._drain)
+        self._protocol.connection_made(self)
+    
+    def _drain(self) -> None:
+        """读取已到达的数据包，单次最多 UDP_RECV_BATCH_SIZE 个，避免阻塞事件循环
+        
+        数据包以缓冲区的 memoryview 形式传递，仅在回调期间有效
+        """
+        sock = self._sock
+        buffer = self._buffer
+        view = self._view
+        datagram_received = self._protocol.datagram_received
+        
+        for _ in range(UDP_RECV_BATCH_SIZE):
+            try:
+                nbytes, addr = sock.recvfrom_into(buffer)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self._protocol.error_received(e)
+                return
+            datagram_received(view[:nbytes], addr)
+    
+    def close(self) -> None:
+        """关闭读取器并释放套接字"""
+        if self._closing:
+            return
+        self._closing = True
+        self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._view.release()
+        self._protocol.connection_lost(None)
+    
+    def is_closing(self) -> bool:
+        """检查读取器是否已关闭"""
+        return self._closing
+
+@dataclass(slots=True)
+class ClientInfo:
+    """客户端状态记录"""
+    address: str
+    last_seen: float
+    type: str
+    last_heartbeat: Optional[float] = None
+    last_registration: Optional[float] = None
+    registration_data: Optional[str] = None
+    last_wind_log: Optional[float] = None
 
 class UDPProtocol(asyncio.DatagramProtocol):
     """UDP协议处理器"""
     
-    def __init__(self, hass: HomeAssistant):
+    __slots__ = ('hass', '_loop', '_bus_fire', 'known_clients', '_data_parser')
+    
+    def __init__(self, hass: HomeAssistant, loop: asyncio.AbstractEventLoop):
         self.hass = hass
-        self.known_clients: Dict[str, Dict[str, Any]] = {}
+        self._loop = loop
+        self._bus_fire = hass.bus.async_fire
+        self.known_clients: 'OrderedDict[Tuple[str, int], ClientInfo]' = OrderedDict()
         self._data_parser = ModBusDataParser()
         
-    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+    def datagram_received(self, data: Union[bytes, memoryview], addr: Tuple[str, int]) -> None:
         """接收UDP数据包"""
         try:
-            addr_str = f"{addr[0]}:{addr[1]}"
-            _LOGGER.debug(f"收到UDP数据包: {len(data)}字节 from {addr_str}")
+            # 每个数据包只读取一次时钟，供状态更新和事件共用
+            now = self._loop.time()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("收到UDP数据包: %d字节 from %s:%s", len(data), addr[0], addr[1])
             
-            # 尝试解码数据
-            decoded_data = self._decode_data(data)
-            if decoded_data is None:
-                _LOGGER.warning(f"无法解码UDP数据包 from {addr_str}, 长度: {len(data)}")
-                return
+            # 先按长度和首字节分流：只有可能是ModBus帧的数据包才进入解析器
+            if len(data) == MODBUS_EXPECTED_LENGTH and data[0] == MODBUS_DEVICE_ADDR:
+                modbus_result = self._data_parser.parse_modbus_data(data)
+                if modbus_result is not None:
+                    self._process_wind_data(modbus_result, addr, now)
+                    return
+            
+            # 接收缓冲区会被复用，非ModBus数据包需复制为独立的 bytes（已是 bytes 时不复制）
+            data = bytes(data)
             
-            # 处理不同类型的数据包
-            if self._is_text_packet(decoded_data):
-                self._handle_text_packet(decoded_data, addr_str)
+            # 直接在原始字节上识别文本数据包，无需解码
+            packet_type = self._classify_text_packet(data)
+            if packet_type is not None:
+                self._handle_text_packet(data, addr, packet_type, now)
             else:
                 # 处理风力数据
-                self._handle_wind_data_packet(decoded_data, addr_str)
+                self._handle_wind_data_packet(data, addr, now)
                 
         except Exception as e:
-            _LOGGER.error(f"处理UDP数据包失败 from {addr}: {e}")
+            _LOGGER.error("处理UDP数据包失败 from %s:%s: %s", addr[0], addr[1], e)
             
-    def _decode_data(self, data: bytes) -> Optional[str]:
-        """解码数据包"""
-        # 优先处理ModBus数据
-        modbus_result = self._data_parser.parse_modbus_data(data)
-        if modbus_result:
-            return modbus_result
-        
-        # 尝试文本解码
-        return self._try_text_decode(data)
-    
-    def _try_text_decode(self, data: bytes) -> Optional[str]:
-        """尝试文本解码"""
-        encodings = ['utf-8', 'gbk', 'gb2312', 'ascii', 'latin1']
+    def _decode_text(self, data: bytes) -> str:
+        """解码文本数据包，仅在需要文本内容时调用"""
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
         
-        for encoding in encodings:
+        for decode in _FALLBACK_DECODERS:
             try:
-                decoded = data.decode(encoding)
-                if encoding != 'utf-8':
-                    _LOGGER.debug(f"使用 {encoding} 编码成功解码数据")
-                return decoded
-            except (UnicodeDecodeError, UnicodeError):
+                return decode(data)[0]
+            except UnicodeDecodeError:
                 continue
         
-        return None
+        # latin1 可解码任意字节，作为最后手段
+        return data.decode('latin1')
     
-    def _is_text_packet(self, data: str) -> bool:
-        """检查是否为文本数据包（心跳包或注册包）"""
-        text_indicators = HEARTBEAT_INDICATORS + REGISTRATION_INDICATORS
-        data_lower = data.lower()
-        return any(indicator in data_lower for indicator in text_indicators)
+    def _classify_text_packet(self, data: bytes) -> Optional[str]:
+        """识别文本数据包类型（心跳包或注册包），非文本数据包返回None"""
+        match = _TEXT_INDICATOR_PATTERN.search(data)
+        if match is None:
+            return None
+        
+        # 心跳包优先：命中心跳指示符，或注册指示符之后仍出现心跳指示符
+        if (match.group().lower() in _HEARTBEAT_MATCHES
+                or _HEARTBEAT_PATTERN.search(data, match.start() + 1)):
+            return 'heartbeat'
+        return 'registration'
     
-    def _handle_text_packet(self, data: str, addr: str) -> None:
+    def _handle_text_packet(self, data: bytes, addr: Tuple[str, int], packet_type: str, now: float) -> None:
         """处理文本数据包"""
-        data_lower = data.lower()
-        
-        if any(indicator in data_lower for indicator in HEARTBEAT_INDICATORS):
-            self._handle_heartbeat(data, addr)
-        elif any(indicator in data_lower for indicator in REGISTRATION_INDICATORS):
-            self._handle_registration(data, addr)
+        data = self._decode_text(data)
+        if packet_type == 'heartbeat':
+            self._handle_heartbeat(data, addr, now)
         else:
-            _LOGGER.debug(f"收到未知文本数据包 from {addr}: {data[:50]}")
+            self._handle_registration(data, addr, now)
+    
+    def _handle_wind_data_packet(self, data: bytes, addr: Tuple[str, int], now: float) -> None:
+        """处理JSON格式的风力数据包"""
+        try:
+            json_data = orjson.loads(data)
+        except ValueError:
+            # 包括 JSONDecodeError 以及无法按UTF-8解码的字节
+            _LOGGER.debug("收到非JSON风力数据 from %s:%s: %s", addr[0], addr[1], data[:50])
+            return
+        
+        # JSON 对象的键只能是字符串，统一转换为与ModBus解析结果一致的整数字段编号
+        wind_data = json_data.get('wind_data') if isinstance(json_data, dict) else None
+        if isinstance(wind_data, dict):
+            json_data['wind_data'] = {_WIND_FIELD_KEYS.get(key, key): value for key, value in wind_data.items()}
+        
+        self._process_wind_data(json_data, addr, now)
     
-    def _handle_wind_data_packet(self, data: str, addr: str) -> None:
-        """处理风力数据包"""
+    def _process_wind_data(self, json_data: Dict[str, Any], addr: Tuple[str, int], now: float) -> None:
+        """处理已解析的风力数据"""
         try:
-            json_data = json.loads(data)
             wind_data = json_data.get('wind_data', {})
             
-            if wind_data:
+            # 仅接受非空的字段字典，其他类型的远端输入不触发事件
+            if wind_data and isinstance(wind_data, dict):
                 # 更新客户端状态
-                self._update_client_status(addr, 'wind_sensor')
+                info = self._update_client_status(addr, 'wind_sensor', now)
                 
-                # 触发风力数据事件
-                self._fire_wind_data_event(wind_data, json_data.get('timestamp'), addr)
+                # 触发风力数据事件（未携带时间戳时使用事件循环时间，与心跳/注册事件一致）
+                timestamp = json_data.get('timestamp')
+                if timestamp is None:
+                    timestamp = now
+                self._fire_wind_data_event(wind_data, timestamp, info.address)
                 
                 # 记录风力数据
-                self._log_wind_data(wind_data, addr)
+                self._log_wind_data(wind_data, info, now)
             
-        except json.JSONDecodeError:
-            _LOGGER.debug(f"收到非JSON风力数据 from {addr}: {data[:50]}")
         except Exception as e:
-            _LOGGER.error(f"处理风力数据失败 from {addr}: {e}")
+            _LOGGER.error("处理风力数据失败 from %s:%s: %s", addr[0], addr[1], e)
     
-    def _fire_wind_data_event(self, wind_data: Dict[str, Any], timestamp: str, addr: str) -> None:
+    def _fire_wind_data_event(self, wind_data: Dict[str, Any], timestamp: Any, addr: str) -> None:
         """触发风力数据事件"""
-        event_data = {
-            'event_type': 'wind_data_received',
-            'wind_data': wind_data,
-            'timestamp': timestamp,
-            'source_addr': addr
-        }
-        self.hass.bus.async_fire(f'{DOMAIN}_event', event_data)
-    
-    def _log_wind_data(self, wind_data: Dict[str, Any], addr: str) -> None:
-        """记录风力数据"""
-        wind_speed = wind_data.get('0', 0) / WIND_SPEED_SCALE
-        wind_direction = wind_data.get('2', 0) / WIND_DIRECTION_SCALE
-        wind_level = wind_data.get('1', 0)
-        _LOGGER.info(f"风力数据更新 from {addr}: 风速={wind_speed:.1f}m/s, 风向={wind_direction:.1f}°, 风级={wind_level}")
-    
-    def _handle_heartbeat(self, data: str, addr: str) -> None:
+        event_data = _WIND_EVENT_TEMPLATE.copy()
+        event_data['wind_data'] = wind_data
+        event_data['timestamp'] = timestamp
+        event_data['source_addr'] = addr
+        self._bus_fire(EVENT_TOPIC, event_data)
+    
+    def _log_wind_data(self, wind_data: Dict[str, Any], info: ClientInfo, now: float) -> None:
+        """记录风力数据（每个客户端按 WIND_DATA_LOG_INTERVAL 限频）"""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
+        last_log = info.last_wind_log
+        if last_log is not None and now - last_log < WIND_DATA_LOG_INTERVAL:
+            return
+        info.last_wind_log = now
+        
+        wind_speed = wind_data.get(0, 0) * _INV_WIND_SPEED_SCALE
+        wind_direction = wind_data.get(2, 0) * _INV_WIND_DIRECTION_SCALE
+        wind_level = wind_data.get(1, 0)
+        _LOGGER.info("风力数据更新 from %s: 风速=%.1fm/s, 风向=%.1f°, 风级=%s",
+                     info.address, wind_speed, wind_direction, wind_level)
+    
+    def _handle_heartbeat(self, data: str, addr: Tuple[str, int], now: float) -> None:
         """处理心跳包"""
-        _LOGGER.debug(f"收到心跳包 from {addr}")
-        
-        self._update_client_status(addr, 'heartbeat')
+        info = self._update_client_status(addr, 'heartbeat', now)
+        _LOGGER.debug("收到心跳包 from %s", info.address)
         
         # 触发心跳事件
-        self._fire_heartbeat_event(data, addr)
+        self._fire_heartbeat_event(data, info.address, now)
     
-    def _fire_heartbeat_event(self, data: str, addr: str) -> None:
+    def _fire_heartbeat_event(self, data: str, addr: str, now: float) -> None:
         """触发心跳事件"""
-        event_data = {
-            'event_type': 'device_heartbeat',
-            'device_addr': addr,
-            'heartbeat_data': data[:100],
-            'timestamp': asyncio.get_event_loop().time()
-        }
-        self.hass.bus.async_fire(f'{DOMAIN}_event', event_data)
+        event_data = _HEARTBEAT_EVENT_TEMPLATE.copy()
+        event_data['device_addr'] = addr
+        event_data['heartbeat_data'] = data[:100]
+        event_data['timestamp'] = now
+        self._bus_fire(EVENT_TOPIC, event_data)
     
-    def _handle_registration(self, data: str, addr: str) -> None:
+    def _handle_registration(self, data: str, addr: Tuple[str, int], now: float) -> None:
         """处理注册包"""
-        _LOGGER.info(f"收到设备注册 from {addr}")
-        
-        self._update_client_status(addr, 'registration', {'registration_data': data})
+        info = self._update_client_status(addr, 'registration', now, registration_data=data)
+        _LOGGER.info(f"收到设备注册 from {info.address}")
         
         # 触发注册事件
-        self._fire_registration_event(data, addr)
+        self._fire_registration_event(data, info.address, now)
     
-    def _fire_registration_event(self, data: str, addr: str) -> None:
+    def _fire_registration_event(self, data: str, addr: str, now: float) -> None:
         """触发注册事件"""
-        event_data = {
-            'event_type': 'device_registered',
-            'device_addr': addr,
-            'registration_data': data,
-            'timestamp': asyncio.get_event_loop().time()
-        }
-        self.hass.bus.async_fire(f'{DOMAIN}_event', event_data)
-    
-    def _update_client_status(self, addr: str, client_type: str, extra_data: Optional[Dict] = None) -> None:
-        """更新客户端状态"""
-        current_time = asyncio.get_event_loop().time()
-        
-        client_info = {
-            'last_seen': current_time,
-            'type': client_type
-        }
-        
-        if extra_data:
-            client_info.update(extra_data)
+        event_data = _REGISTRATION_EVENT_TEMPLATE.copy()
+        event_data['device_addr'] = addr
+        event_data['registration_data'] = data
+        event_data['timestamp'] = now
+        self._bus_fire(EVENT_TOPIC, event_data)
+    
+    def _update_client_status(self, addr: Tuple[str, int], client_type: str, current_time: float,
+                              registration_data: Optional[str] = None) -> ClientInfo:
+        """更新客户端状态，返回该客户端的状态记录"""
+        # 复用已有记录，仅首次出现时创建；按最近活跃排序，超出上限时淘汰最久未活跃的客户端
+        # 以地址元组为键，"ip:port" 字符串只在首次出现时格式化一次
+        known_clients = self.known_clients
+        info = known_clients.get(addr)
+        if info is None:
+            info = known_clients[addr] = ClientInfo(f"{addr[0]}:{addr[1]}", current_time, client_type)
+            if len(known_clients) > MAX_KNOWN_CLIENTS:
+                known_clients.popitem(last=False)
+        else:
+            info.last_seen = current_time
+            info.type = client_type
+            known_clients.move_to_end(addr)
         
-        # 保留特定的时间戳字段
+        # 保留特定的时间戳字段及注册数据
         if client_type == 'heartbeat':
-            client_info['last_heartbeat'] = current_time
+            info.last_heartbeat = current_time
         elif client_type == 'registration':
-            client_info['last_registration'] = current_time
+            info.last_registration = current_time
+            if registration_data is not None:
+                info.registration_data = registration_data
         
-        self.known_clients[addr] = client_info
+        return info
     
     def get_client_status(self) -> Dict[str, Dict[str, Any]]:
         """获取客户端状态信息"""
-        current_time = asyncio.get_event_loop().time()
+        current_time = self._loop.time()
         status = {}
         
-        for addr, info in self.known_clients.items():
-            last_seen = info.get('last_seen', 0)
+        for info in self.known_clients.values():
+            last_seen = info.last_seen
             offline_duration = current_time - last_seen
             
-            status[addr] = {
-                'type': info.get('type', 'unknown'),
+            status[info.address] = {
+                'type': info.type,
                 'last_seen': last_seen,
                 'online': offline_duration < OFFLINE_THRESHOLD,
                 'offline_duration': offline_duration
@@ -562,92 +735,53 @@ class UDPProtocol(asyncio.DatagramProtocol):
 class ModBusDataParser:
     """ModBus数据解析器"""
     
-    def parse_modbus_data(self, data: bytes) -> Optional[str]:
-        """解析ModBus数据"""
-        # 检查标准ModBus RTU格式
-        if self._is_standard_modbus(data):
-            return self._parse_standard_modbus(data)
-        
-        return None
+    __slots__ = ()
     
-    def _is_standard_modbus(self, data: bytes) -> bool:
-        """检查是否为标准ModBus RTU格式"""
-        if len(data) < 5:
-            return False
-        
-        device_addr, function_code = data[0], data[1]
-        
-        if device_addr == MODBUS_DEVICE_ADDR and function_code == MODBUS_FUNCTION_CODE:
-            if len(data) >= 3:
-                data_length = data[2]
-                expected_length = 3 + data_length + 2  # 头部 + 数据 + CRC
-                return len(data) == expected_length and data_length == MODBUS_DATA_LENGTH
+    def parse_modbus_data(self, data: Union[bytes, memoryview]) -> Optional[Dict[str, Any]]:
+        """解析ModBus数据，非标准帧或CRC校验失败时返回None
         
-        return False
-    
-    def _parse_standard_modbus(self, data: bytes) -> Optional[str]:
-        """解析标准ModBus RTU数据"""
-        try:
-            if len(data) < MODBUS_EXPECTED_LENGTH:
-                return None
-            
-            device_addr, function_code, data_length = data[0], data[1], data[2]
-            register_data = data[3:11]  # 8字节寄存器数据
-            crc = data[11:13]  # CRC校验
-            
-            _LOGGER.debug(f"ModBus解析: 设备=0x{device_addr:02X}, 功能码=0x{function_code:02X}, "
-                         f"数据长度={data_length}, 寄存器={register_data.hex()}, CRC={crc.hex()}")
-            
-            return self._parse_register_data(register_data)
-            
-        except Exception as e:
-            _LOGGER.error(f"标准ModBus数据解析失败: {e}")
+        帧头检查、解包、CRC校验与结果构建在同一函数内完成，每帧只有一次 struct 调用
+        """
+        # 检查标准ModBus RTU格式（逐字节比较帧头，对 bytes 与 memoryview 均适用且不产生切片）
+        if (len(data) != MODBUS_EXPECTED_LENGTH
+                or data[0] != MODBUS_DEVICE_ADDR
+                or data[1] != MODBUS_FUNCTION_CODE
+                or data[2] != MODBUS_DATA_LENGTH):
             return None
-    
-    def _parse_register_data(self, register_data: bytes) -> str:
-        """解析寄存器数据"""
-        if len(register_data) < 8:
-            raise ValueError("寄存器数据长度不足")
         
-        # 解析4个寄存器（每个2字节，大端序）
-        wind_values = self._extract_wind_values(register_data)
+        # 一次性解包整个帧
+        (device_addr, function_code, data_length, wind_speed_raw, wind_level,
+         wind_direction_raw, wind_direction_code, crc_low, crc_high) = _MODBUS_FRAME.unpack_from(data)
         
-        # 构建JSON数据
-        wind_json = self._build_wind_json(wind_values)
+        # 校验CRC16（低字节在前）
+        received_crc = crc_low | (crc_high << 8)
+        calculated_crc = _crc16_modbus(data, MODBUS_EXPECTED_LENGTH - 2)
+        if received_crc != calculated_crc:
+            # 位于接收热路径，校验失败的帧可能持续到达，仅以 DEBUG 级别延迟格式化输出
+            _LOGGER.debug("ModBus CRC校验失败: 接收=0x%04X, 计算=0x%04X", received_crc, calculated_crc)
+            return None
         
-        # 记录解析日志
-        self._log_parsed_data(wind_values)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("ModBus解析: 设备=0x%02X, 功能码=0x%02X, 数据长度=%d, 寄存器=%04x%04x%04x%04x, CRC=%02x%02x",
+                          device_addr, function_code, data_length, wind_speed_raw, wind_level,
+                          wind_direction_raw, wind_direction_code, crc_low, crc_high)
+            self._log_parsed_data(wind_speed_raw, wind_level, wind_direction_raw, wind_direction_code)
         
-        return json.dumps(wind_json)
-    
-    def _extract_wind_values(self, register_data: bytes) -> Dict[str, int]:
-        """从寄存器数据中提取风力数值"""
-        return {
-            'wind_speed_raw': int.from_bytes(register_data[0:2], 'big'),
-            'wind_level': int.from_bytes(register_data[2:4], 'big'),
-            'wind_direction_raw': int.from_bytes(register_data[4:6], 'big'),
-            'wind_direction_code': int.from_bytes(register_data[6:8], 'big')
-        }
-    
-    def _build_wind_json(self, wind_values: Dict[str, int]) -> Dict[str, Any]:
-        """构建风力数据JSON结构"""
+        # 构建风力数据结构（与JSON数据包格式一致，字段编号为整数键）
         return {
             "wind_data": {
-                "0": wind_values['wind_speed_raw'],      # 原始风速值
-                "1": wind_values['wind_level'],          # 风级
-                "2": wind_values['wind_direction_raw'],  # 原始风向角度值
-                "3": wind_values['wind_direction_code']  # 风向编码
-            },
-            "timestamp": datetime.now().isoformat()
+                0: wind_speed_raw,      # 原始风速值
+                1: wind_level,          # 风级
+                2: wind_direction_raw,  # 原始风向角度值
+                3: wind_direction_code  # 风向编码
+            }
         }
     
-    def _log_parsed_data(self, wind_values: Dict[str, int]) -> None:
-        """记录解析后的数据"""
-        wind_speed_ms = wind_values['wind_speed_raw'] / WIND_SPEED_SCALE
-        wind_direction_deg = wind_values['wind_direction_raw'] / WIND_DIRECTION_SCALE
-        wind_level = wind_values['wind_level']
-        wind_direction_code = wind_values['wind_direction_code']
+    def _log_parsed_data(self, wind_speed_raw: int, wind_level: int,
+                         wind_direction_raw: int, wind_direction_code: int) -> None:
+        """记录解析后的数据（仅在DEBUG级别启用时调用）"""
+        wind_speed_ms = wind_speed_raw * _INV_WIND_SPEED_SCALE
+        wind_direction_deg = wind_direction_raw * _INV_WIND_DIRECTION_SCALE
         
-        _LOGGER.debug(f"风力数据解析完成: 风速={wind_speed_ms:.1f}m/s, 风级={wind_level}, "
-                     f"风向={wind_direction_deg:.1f}°, 编码=0x{wind_direction_code:02X}")
-
+        _LOGGER.debug("风力数据解析完成: 风速=%.1fm/s, 风级=%d, 风向=%.1f°, 编码=0x%02X",
+                      wind_speed_ms, wind_level, wind_direction_deg, wind_direction_code)
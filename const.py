@@ -3,6 +3,9 @@
 # 集成域名
 DOMAIN = "wind_udp_receiver"
 
+# 集成事件总线主题 (UDP 服务器触发、传感器监听)
+EVENT_TOPIC = f"{DOMAIN}_event"
+
 # 平台列表
 PLATFORMS = ["sensor"]
 
@@ -11,9 +14,21 @@ MODBUS_DEVICE_ADDR = 0x80
 MODBUS_FUNCTION_CODE = 0x03
 MODBUS_DATA_LENGTH = 8
 MODBUS_EXPECTED_LENGTH = 13  # 3字节头部 + 8字节数据 + 2字节CRC
+MODBUS_CRC_POLYNOMIAL = 0xA001  # CRC16-Modbus 反转多项式
+
+# UDP 接收配置
+UDP_RECV_BATCH_SIZE = 32        # 每次可读事件最多读取的数据包数量
+UDP_MAX_DATAGRAM_SIZE = 65535   # 单个数据包最大长度 (字节)
+UDP_MAX_RECEIVE_SOCKETS = 4     # SO_REUSEPORT 可用时绑定的接收套接字数量上限
 
 # 客户端状态配置
 OFFLINE_THRESHOLD = 60  # 统一离线阈值 (秒)
+DEVICE_STATUS_REFRESH_INTERVAL = 30  # 设备状态属性（离线时长等）的刷新间隔 (秒)
+MAX_KNOWN_CLIENTS = 4096  # 记录的客户端数量上限，超出时淘汰最久未活跃的客户端
+WIND_DATA_LOG_INTERVAL = 1.0  # 同一客户端风力数据 INFO 日志的最小间隔 (秒)
+
+# 传感器更新配置
+WIND_UPDATE_COALESCE_INTERVAL = 0.1  # 合并窗口内的多次风力数据只更新一次传感器 (秒)
 
 # 数据转换配置
 WIND_SPEED_SCALE = 10.0     # 风速除数因子
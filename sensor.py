@@ -1,22 +1,39 @@
-import asyncio
+import bisect
 import logging
-from typing import Dict, Any, Optional, Union
+import time
+from typing import Dict, Any, Optional, Union, List, Callable, Tuple
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfSpeed
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util
 
 from .const import (
-    DOMAIN, WIND_DIRECTION_MAP, WIND_LEVEL_MAP, BEAUFORT_SCALE_THRESHOLDS,
+    DOMAIN, EVENT_TOPIC, WIND_DIRECTION_MAP, WIND_LEVEL_MAP, BEAUFORT_SCALE_THRESHOLDS,
     DIRECTION_ANGLE_RANGES, WIND_SPEED_SCALE, WIND_DIRECTION_SCALE,
-    OFFLINE_THRESHOLD
+    OFFLINE_THRESHOLD, DEVICE_STATUS_REFRESH_INTERVAL, WIND_UPDATE_COALESCE_INTERVAL
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# 实体唯一ID前缀 (导入时构建一次)
+_UNIQUE_ID_PREFIX = f'{DOMAIN}_'
+
+# 蒲福风级与16方位的阈值/名称拆分为有序元组，二分查找（bisect_right 对应原先的 "<" 判断）
+_BEAUFORT_THRESHOLDS = tuple(threshold for threshold, _ in BEAUFORT_SCALE_THRESHOLDS)
+_BEAUFORT_DESCRIPTIONS = tuple(description for _, description in BEAUFORT_SCALE_THRESHOLDS) + ("12级 (飓风)",)
+_DIRECTION_THRESHOLDS = tuple(threshold for threshold, _ in DIRECTION_ANGLE_RANGES)
+_DIRECTION_NAMES = tuple(direction for _, direction in DIRECTION_ANGLE_RANGES) + ("北",)  # 348.75°以上回到北
+
+# 属性缓存的初始键，与任何状态值都不相等
+_UNSET = object()
+
+# 风向名称到编码的反向映射
+_WIND_DIRECTION_CODES = {name: code for code, name in WIND_DIRECTION_MAP.items()}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry, 
@@ -25,13 +42,19 @@ async def async_setup_entry(
     """设置传感器实体"""
     
     try:
+        # 每个配置条目一个分发器，风力传感器共用同一个事件监听
+        coordinator = WindCoordinator(hass)
+        entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if entry_data is not None:
+            entry_data["coordinator"] = coordinator
+        
         sensors = [
-            WindSpeedSensor(hass, entry.entry_id),           # 风速传感器
-            WindLevelSensor(hass, entry.entry_id),           # 风级传感器
-            WindDirectionSensor(hass, entry.entry_id),       # 风向角度传感器
-            WindDirectionCodeSensor(hass, entry.entry_id),   # 风向编码传感器
-            DeviceStatusSensor(hass, entry.entry_id),        # 设备状态传感器
-            LastUpdateSensor(hass, entry.entry_id),          # 最后更新传感器
+            WindSpeedSensor(hass, entry.entry_id, coordinator),           # 风速传感器
+            WindLevelSensor(hass, entry.entry_id, coordinator),           # 风级传感器
+            WindDirectionSensor(hass, entry.entry_id, coordinator),       # 风向角度传感器
+            WindDirectionCodeSensor(hass, entry.entry_id, coordinator),   # 风向编码传感器
+            DeviceStatusSensor(hass, entry.entry_id),                     # 设备状态传感器
+            LastUpdateSensor(hass, entry.entry_id, coordinator),          # 最后更新传感器
         ]
         
         async_add_entities(sensors, True)
@@ -40,125 +63,212 @@ async def async_setup_entry(
     except Exception as e:
         _LOGGER.error(f"设置传感器实体失败: {e}")
 
+@callback
+def _wind_event_filter(event_data: Dict[str, Any]) -> bool:
+    """事件总线预过滤：只放行风力数据事件，其他事件不会调度回调"""
+    return event_data.get('event_type') == 'wind_data_received'
+
+class WindCoordinator:
+    """风力数据分发器 - 单个事件监听器将风力数据分发给所有已注册的风力传感器
+    
+    合并窗口内收到的多个数据包只分发一次（各字段取最新值），减少状态写入次数
+    """
+    
+    __slots__ = ('hass', '_interval', '_handlers', '_unsub_listener', '_pending_wind_data', '_unsub_flush')
+    
+    def __init__(self, hass: HomeAssistant, interval: float = WIND_UPDATE_COALESCE_INTERVAL):
+        self.hass = hass
+        self._interval = interval
+        # 注册时预先绑定 (传感器类型, 数据应用方法, 状态写入方法)，分发时无需逐个查找属性
+        self._handlers: List[Tuple[str, Callable[[Dict[str, Any]], bool], Callable[[], None]]] = []
+        self._unsub_listener: Optional[Callable[[], None]] = None
+        self._pending_wind_data: Dict[str, Any] = {}
+        self._unsub_flush: Optional[Callable[[], None]] = None
+    
+    @callback
+    def async_add_sensor(self, sensor: 'BaseWindSensor') -> Callable[[], None]:
+        """注册传感器，首个传感器注册时开始监听事件；返回注销回调"""
+        handler = (sensor.sensor_type, sensor._apply_wind_data, sensor.async_write_ha_state)
+        self._handlers.append(handler)
+        if self._unsub_listener is None:
+            self._unsub_listener = self.hass.bus.async_listen(
+                EVENT_TOPIC, self._dispatch, event_filter=_wind_event_filter
+            )
+        
+        @callback
+        def remove_sensor() -> None:
+            """注销传感器，最后一个传感器移除时停止监听"""
+            self._handlers.remove(handler)
+            if not self._handlers and self._unsub_listener is not None:
+                self._unsub_listener()
+                self._unsub_listener = None
+                if self._unsub_flush is not None:
+                    self._unsub_flush()
+                    self._unsub_flush = None
+                self._pending_wind_data.clear()
+        
+        return remove_sensor
+    
+    @callback
+    def _dispatch(self, event) -> None:
+        """暂存风力数据并安排合并分发（事件类型已由 _wind_event_filter 过滤）"""
+        wind_data = event.data.get('wind_data')
+        if not isinstance(wind_data, dict):
+            return
+        self._pending_wind_data.update(wind_data)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, self._interval, self._flush)
+    
+    @callback
+    def _flush(self, _now) -> None:
+        """将合并窗口内的最新风力数据分发给各传感器
+        
+        先更新所有传感器的值，再集中写入发生变化的状态，使状态变更在同一轮事件循环中相邻发出
+        """
+        self._unsub_flush = None
+        wind_data = self._pending_wind_data
+        if not wind_data:
+            return
+        self._pending_wind_data = {}
+        
+        changed = []
+        for sensor_type, apply_wind_data, write_ha_state in self._handlers:
+            try:
+                if apply_wind_data(wind_data):
+                    changed.append((sensor_type, write_ha_state))
+            except Exception as e:
+                _LOGGER.error(f"{sensor_type}传感器事件处理失败: {e}")
+        
+        for sensor_type, write_ha_state in changed:
+            try:
+                write_ha_state()
+            except Exception as e:
+                _LOGGER.error(f"{sensor_type}传感器状态写入失败: {e}")
+
 class BaseWindSensor(SensorEntity):
     """风力传感器基类"""
     
-    def __init__(self, hass: HomeAssistant, entry_id: str, sensor_type: str, 
-                 name: str, unique_id: str, icon: str = "mdi:weather-windy"):
+    # 仅声明本集成自有的属性；_attr_* 与 hass 由 HA 实体基类（含缓存属性元类）管理，不能放入 __slots__
+    __slots__ = ('entry_id', 'sensor_type', '_coordinator', '_attrs_cache_key', '_attrs_cache')
+    
+    def __init__(self, hass: HomeAssistant, entry_id: str, coordinator: WindCoordinator,
+                 sensor_type: str, name: str, unique_id: str, icon: str = "mdi:weather-windy"):
         self.hass = hass
         self.entry_id = entry_id
+        self._coordinator = coordinator
         self.sensor_type = sensor_type
         self._attr_name = name
-        self._attr_unique_id = f"{DOMAIN}_{unique_id}_{entry_id}"
+        self._attr_unique_id = f"{_UNIQUE_ID_PREFIX}{unique_id}_{entry_id}"
         self._attr_icon = icon
         self._attr_native_value = None
         self._attr_should_poll = False
+        # 额外状态属性缓存，以生成时的状态值为键
+        self._attrs_cache_key: Any = _UNSET
+        self._attrs_cache: Optional[Dict[str, Any]] = None
         
     async def async_added_to_hass(self) -> None:
-        """当传感器添加到HA时注册事件监听"""
+        """当传感器添加到HA时注册到风力数据分发器"""
         await super().async_added_to_hass()
         
-        @callback
-        def handle_wind_event(event):
-            """处理风力事件"""
-            try:
-                if not self.entity_id:
-                    _LOGGER.debug(f"{self.sensor_type}传感器实体ID尚未设置，跳过更新")
-                    return
-                
-                event_type = event.data.get('event_type')
-                if event_type == 'wind_data_received':
-                    self._handle_wind_data(event.data.get('wind_data', {}))
-                    
-            except Exception as e:
-                _LOGGER.error(f"{self.sensor_type}传感器事件处理失败: {e}")
-        
-        # 注册事件监听
-        self.async_on_remove(
-            self.hass.bus.async_listen(f'{DOMAIN}_event', handle_wind_event)
-        )
+        # 实体ID此时已设置；移除实体时自动从分发器注销
+        self.async_on_remove(self._coordinator.async_add_sensor(self))
+    
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        """返回额外状态属性（按当前值缓存，值变化时才重新构建）"""
+        value = self._attr_native_value
+        if value != self._attrs_cache_key:
+            self._attrs_cache = self._build_state_attributes(value)
+            self._attrs_cache_key = value
+        return self._attrs_cache
     
-    def _handle_wind_data(self, wind_data: Dict[str, Any]) -> None:
-        """处理风力数据 - 子类需要重写此方法"""
-        raise NotImplementedError("子类必须实现 _handle_wind_data 方法")
+    def _build_state_attributes(self, value: Any) -> Optional[Dict[str, Any]]:
+        """构建额外状态属性 - 子类按需重写"""
+        return None
+    
+    def _apply_wind_data(self, wind_data: Dict[str, Any]) -> bool:
+        """应用风力数据，返回是否需要写入状态 - 子类需要重写此方法"""
+        raise NotImplementedError("子类必须实现 _apply_wind_data 方法")
     
-    def _update_state(self, value: Union[int, float, str], log_message: str = "") -> None:
-        """更新传感器状态"""
+    def _set_native_value(self, value: Union[int, float, str], log_template: str = "", *log_args: Any) -> bool:
+        """设置传感器值，返回是否需要写入状态（值未变化时无需写入，force_update 的传感器除外）
+        
+        状态由分发器统一写入；日志使用 %-格式模板与参数，仅在 INFO 级别启用时才格式化
+        """
+        if value == self._attr_native_value and not self._attr_force_update:
+            return False
         self._attr_native_value = value
-        self.async_write_ha_state()
         
-        if log_message:
-            _LOGGER.info(f"{self.sensor_type}: {log_message}")
+        if log_template and _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("%s: " + log_template, self.sensor_type, *log_args)
+        return True
 
 class WindSpeedSensor(BaseWindSensor):
     """风速传感器"""
     
-    def __init__(self, hass: HomeAssistant, entry_id: str):
+    def __init__(self, hass: HomeAssistant, entry_id: str, coordinator: WindCoordinator):
         super().__init__(
-            hass, entry_id, "风速", "Wind Speed", "wind_speed", "mdi:weather-windy"
+            hass, entry_id, coordinator, "风速", "Wind Speed", "wind_speed", "mdi:weather-windy"
         )
         self._attr_native_unit_of_measurement = UnitOfSpeed.METERS_PER_SECOND
         self._attr_device_class = SensorDeviceClass.WIND_SPEED
         # 确保默认显示单位为 m/s
         self._attr_suggested_unit_of_measurement = UnitOfSpeed.METERS_PER_SECOND
         
-    def _handle_wind_data(self, wind_data: Dict[str, Any]) -> None:
-        """处理风速数据"""
-        if '0' in wind_data:
-            raw_value = wind_data['0']
+    def _apply_wind_data(self, wind_data: Dict[str, Any]) -> bool:
+        """应用风速数据"""
+        raw_value = wind_data.get(0)
+        if raw_value is not None:
             wind_speed_ms = raw_value / WIND_SPEED_SCALE  # 转换为m/s
             
-            self._update_state(
+            return self._set_native_value(
                 wind_speed_ms, 
-                f"风速更新为 {wind_speed_ms:.1f} m/s (原始值: {raw_value})"
+                "风速更新为 %.1f m/s (原始值: %s)", wind_speed_ms, raw_value
             )
+        return False
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """返回额外状态属性"""
-        if self._attr_native_value is not None:
+    def _build_state_attributes(self, value: Optional[float]) -> Dict[str, Any]:
+        """构建额外状态属性"""
+        if value is not None:
             return {
-                "wind_speed_ms": self._attr_native_value,
-                "wind_speed_kmh": round(self._attr_native_value * 3.6, 2),
-                "beaufort_scale": self._get_beaufort_scale(self._attr_native_value),
-                "raw_value": int(self._attr_native_value * 10),
+                "wind_speed_ms": value,
+                "wind_speed_kmh": round(value * 3.6, 2),
+                "beaufort_scale": self._get_beaufort_scale(value),
+                "raw_value": int(value * 10),
                 "description": "风速 (m/s)"
             }
         return {}
     
     def _get_beaufort_scale(self, speed_ms: float) -> str:
         """根据风速计算蒲福风级"""
-        for threshold, description in BEAUFORT_SCALE_THRESHOLDS:
-            if speed_ms < threshold:
-                return description
-        return "12级 (飓风)"
+        return _BEAUFORT_DESCRIPTIONS[bisect.bisect_right(_BEAUFORT_THRESHOLDS, speed_ms)]
 
 class WindLevelSensor(BaseWindSensor):
     """风级传感器"""
     
-    def __init__(self, hass: HomeAssistant, entry_id: str):
+    def __init__(self, hass: HomeAssistant, entry_id: str, coordinator: WindCoordinator):
         super().__init__(
-            hass, entry_id, "风级", "Wind Level", "wind_level", "mdi:windsock"
+            hass, entry_id, coordinator, "风级", "Wind Level", "wind_level", "mdi:windsock"
         )
         self._attr_native_unit_of_measurement = "级"
         
-    def _handle_wind_data(self, wind_data: Dict[str, Any]) -> None:
-        """处理风级数据"""
-        if '1' in wind_data:
-            wind_level = wind_data['1']
+    def _apply_wind_data(self, wind_data: Dict[str, Any]) -> bool:
+        """应用风级数据"""
+        wind_level = wind_data.get(1)
+        if wind_level is not None:
             
-            self._update_state(
+            return self._set_native_value(
                 wind_level, 
-                f"风级更新为 {wind_level}级"
+                "风级更新为 %s级", wind_level
             )
+        return False
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """返回额外状态属性"""
-        if self._attr_native_value is not None:
+    def _build_state_attributes(self, value: Optional[int]) -> Dict[str, Any]:
+        """构建额外状态属性"""
+        if value is not None:
             return {
-                "wind_level": self._attr_native_value,
-                "level_description": WIND_LEVEL_MAP.get(self._attr_native_value, f"{self._attr_native_value}级"),
+                "wind_level": value,
+                "level_description": WIND_LEVEL_MAP.get(value, f"{value}级"),
                 "description": "风力等级"
             }
         return {}
@@ -166,31 +276,31 @@ class WindLevelSensor(BaseWindSensor):
 class WindDirectionSensor(BaseWindSensor):
     """风向角度传感器"""
     
-    def __init__(self, hass: HomeAssistant, entry_id: str):
+    def __init__(self, hass: HomeAssistant, entry_id: str, coordinator: WindCoordinator):
         super().__init__(
-            hass, entry_id, "风向角度", "Wind Direction Angle", "wind_direction_angle", "mdi:compass"
+            hass, entry_id, coordinator, "风向角度", "Wind Direction Angle", "wind_direction_angle", "mdi:compass"
         )
         self._attr_native_unit_of_measurement = "°"
         
-    def _handle_wind_data(self, wind_data: Dict[str, Any]) -> None:
-        """处理风向角度数据"""
-        if '2' in wind_data:
-            raw_value = wind_data['2']
+    def _apply_wind_data(self, wind_data: Dict[str, Any]) -> bool:
+        """应用风向角度数据"""
+        raw_value = wind_data.get(2)
+        if raw_value is not None:
             wind_direction_deg = raw_value / WIND_DIRECTION_SCALE  # 转换为度数
             
-            self._update_state(
+            return self._set_native_value(
                 wind_direction_deg, 
-                f"风向角度更新为 {wind_direction_deg:.1f}° (原始值: {raw_value})"
+                "风向角度更新为 %.1f° (原始值: %s)", wind_direction_deg, raw_value
             )
+        return False
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """返回额外状态属性"""
-        if self._attr_native_value is not None:
+    def _build_state_attributes(self, value: Optional[float]) -> Dict[str, Any]:
+        """构建额外状态属性"""
+        if value is not None:
             return {
-                "angle_degrees": self._attr_native_value,
-                "cardinal_direction": self._get_cardinal_direction(self._attr_native_value),
-                "raw_value": int(self._attr_native_value * 10),
+                "angle_degrees": value,
+                "cardinal_direction": self._get_cardinal_direction(value),
+                "raw_value": int(value * 10),
                 "description": "风向角度 (0°=北, 90°=东, 180°=南, 270°=西)"
             }
         return {}
@@ -198,46 +308,37 @@ class WindDirectionSensor(BaseWindSensor):
     def _get_cardinal_direction(self, angle: float) -> str:
         """根据角度获取方位名称"""
         angle = angle % 360  # 标准化角度到0-360范围
-        
-        for threshold, direction in DIRECTION_ANGLE_RANGES:
-            if angle < threshold:
-                return direction
-        return "北"  # 348.75°以上回到北
+        return _DIRECTION_NAMES[bisect.bisect_right(_DIRECTION_THRESHOLDS, angle)]
 
 class WindDirectionCodeSensor(BaseWindSensor):
     """风向编码传感器"""
     
-    def __init__(self, hass: HomeAssistant, entry_id: str):
+    def __init__(self, hass: HomeAssistant, entry_id: str, coordinator: WindCoordinator):
         super().__init__(
-            hass, entry_id, "风向编码", "Wind Direction Code", "wind_direction_code", "mdi:compass-rose"
+            hass, entry_id, coordinator, "风向编码", "Wind Direction Code", "wind_direction_code", "mdi:compass-rose"
         )
         
-    def _handle_wind_data(self, wind_data: Dict[str, Any]) -> None:
-        """处理风向编码数据"""
-        if '3' in wind_data:
-            wind_direction_code = wind_data['3']
-            direction_name = WIND_DIRECTION_MAP.get(wind_direction_code, f"未知编码(0x{wind_direction_code:02X})")
+    def _apply_wind_data(self, wind_data: Dict[str, Any]) -> bool:
+        """应用风向编码数据"""
+        wind_direction_code = wind_data.get(3)
+        if wind_direction_code is not None:
+            direction_name = WIND_DIRECTION_MAP.get(wind_direction_code)
+            if direction_name is None:
+                direction_name = f"未知编码(0x{wind_direction_code:02X})"
             
-            self._update_state(
+            return self._set_native_value(
                 direction_name, 
-                f"风向编码更新为 0x{wind_direction_code:02X} -> {direction_name}"
+                "风向编码更新为 0x%02X -> %s", wind_direction_code, direction_name
             )
+        return False
     
-    def _find_direction_code(self, direction_name: str) -> Optional[int]:
-        """根据方向名称查找对应的编码"""
-        for code_val, name in WIND_DIRECTION_MAP.items():
-            if name == str(direction_name):
-                return code_val
-        return None
-    
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """返回额外状态属性"""
-        if self._attr_native_value:
-            code = self._find_direction_code(self._attr_native_value)
+    def _build_state_attributes(self, value: Optional[str]) -> Dict[str, Any]:
+        """构建额外状态属性"""
+        if value:
+            code = _WIND_DIRECTION_CODES.get(str(value))
             
             return {
-                "direction_name": self._attr_native_value,
+                "direction_name": value,
                 "raw_code_hex": f"0x{code:02X}" if code is not None else "未知",
                 "raw_code_dec": code if code is not None else "未知",
                 "description": "16方位风向编码"
@@ -247,16 +348,24 @@ class WindDirectionCodeSensor(BaseWindSensor):
 class DeviceStatusSensor(SensorEntity):
     """设备状态传感器"""
     
+    __slots__ = ('entry_id', '_last_activity', '_last_activity_wall', '_offline_threshold', '_unsub_offline_check')
+    
+    # 单调时钟（与事件循环时钟同源），类级别绑定，无需经由事件循环查找
+    _monotonic = staticmethod(time.monotonic)
+    
     def __init__(self, hass: HomeAssistant, entry_id: str):
         self.hass = hass
         self.entry_id = entry_id
         self._attr_name = "Wind Device Status"
-        self._attr_unique_id = f"{DOMAIN}_wind_device_status_{entry_id}"
+        self._attr_unique_id = f"{_UNIQUE_ID_PREFIX}wind_device_status_{entry_id}"
         self._attr_native_value = "等待连接"
-        self._attr_should_poll = True
+        # 纯推送：在线状态由事件触发，离线状态及离线期间的属性刷新由定时检查触发，无需轮询
+        self._attr_should_poll = False
         self._attr_icon = "mdi:connection"
-        self._last_activity = None
+        self._last_activity = None       # 单调时钟，用于计算离线时长
+        self._last_activity_wall = None  # Unix 时间戳，用于显示最后活跃时间
         self._offline_threshold = OFFLINE_THRESHOLD  # 离线阈值（秒）
+        self._unsub_offline_check: Optional[Callable[[], None]] = None
         
     async def async_added_to_hass(self) -> None:
         """注册事件监听"""
@@ -264,7 +373,10 @@ class DeviceStatusSensor(SensorEntity):
         def update_activity(event):
             """更新设备活跃时间"""
             try:
-                self._last_activity = asyncio.get_event_loop().time()
+                self._last_activity = self._monotonic()
+                self._last_activity_wall = time.time()
+                if self._unsub_offline_check is None:
+                    self._schedule_offline_check(min(self._offline_threshold, DEVICE_STATUS_REFRESH_INTERVAL))
                 self._update_status_immediate()
                 
             except Exception as e:
@@ -272,56 +384,50 @@ class DeviceStatusSensor(SensorEntity):
         
         # 监听所有wind_udp_receiver_event事件
         self.async_on_remove(
-            self.hass.bus.async_listen(f'{DOMAIN}_event', update_activity)
+            self.hass.bus.async_listen(EVENT_TOPIC, update_activity)
         )
+        self.async_on_remove(self._cancel_offline_check)
         
     def _update_status_immediate(self) -> None:
-        """立即更新状态为在线"""
+        """立即更新状态为在线（已在线时不重复写入状态）"""
+        if self._attr_native_value == "在线":
+            return
         self._attr_native_value = "在线"
         self._attr_icon = "mdi:check-network"
         self.async_write_ha_state()
         _LOGGER.debug("设备状态更新为: 在线")
-        
-    async def async_update(self) -> None:
-        """定期检查离线状态"""
-        self._update_status()
-        
-    def _update_status(self) -> None:
-        """更新设备状态"""
-        try:
-            status_info = self._calculate_device_status()
-            self._apply_status_update(status_info)
-            self.async_write_ha_state()
-        except Exception as e:
-            _LOGGER.error(f"状态更新失败: {e}")
     
-    def _calculate_device_status(self) -> Dict[str, str]:
-        """计算设备状态信息"""
-        if self._last_activity is None:
-            return {
-                "value": "等待连接",
-                "icon": "mdi:connection"
-            }
+    def _schedule_offline_check(self, delay: float) -> None:
+        """安排离线检查（同一时间只保留一个定时器，不随每个事件重新创建）"""
+        self._unsub_offline_check = async_call_later(self.hass, delay, self._check_offline)
+    
+    @callback
+    def _cancel_offline_check(self) -> None:
+        """取消待执行的离线检查"""
+        if self._unsub_offline_check is not None:
+            self._unsub_offline_check()
+            self._unsub_offline_check = None
+    
+    @callback
+    def _check_offline(self, _now) -> None:
+        """离线检查：期间有新活动则刷新状态并重新安排，否则标记为离线
         
-        current_time = asyncio.get_event_loop().time()
-        offline_duration = current_time - self._last_activity
+        在线与离线期间都至少每 DEVICE_STATUS_REFRESH_INTERVAL 写入一次状态，
+        使最后活跃时间、离线时长等属性保持最新（在线时事件本身不写入状态）
+        """
+        self._unsub_offline_check = None
+        remaining = self._last_activity + self._offline_threshold - self._monotonic()
+        if remaining > 0:
+            self.async_write_ha_state()
+            self._schedule_offline_check(min(remaining, DEVICE_STATUS_REFRESH_INTERVAL))
+            return
         
-        if offline_duration < self._offline_threshold:
-            return {
-                "value": "在线",
-                "icon": "mdi:check-network"
-            }
-        else:
-            minutes_offline = int(offline_duration // 60)
-            return {
-                "value": f"离线 {minutes_offline}分钟",
-                "icon": "mdi:network-off"
-            }
-    
-    def _apply_status_update(self, status_info: Dict[str, str]) -> None:
-        """应用状态更新"""
-        self._attr_native_value = status_info["value"]
-        self._attr_icon = status_info["icon"]
+        if self._attr_native_value != "离线":
+            self._attr_native_value = "离线"
+            self._attr_icon = "mdi:network-off"
+            _LOGGER.debug("设备状态更新为: 离线")
+        self.async_write_ha_state()
+        self._schedule_offline_check(DEVICE_STATUS_REFRESH_INTERVAL)
     
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -334,9 +440,10 @@ class DeviceStatusSensor(SensorEntity):
                     "status": "等待连接"
                 }
             
-            current_time = asyncio.get_event_loop().time()
+            current_time = self._monotonic()
             offline_duration = current_time - self._last_activity
-            last_activity_dt = dt_util.utc_from_timestamp(self._last_activity).astimezone(dt_util.DEFAULT_TIME_ZONE)
+            # 单调时钟不是 Unix 时间戳，显示时使用同时记录的墙上时间
+            last_activity_dt = dt_util.utc_from_timestamp(self._last_activity_wall).astimezone(dt_util.DEFAULT_TIME_ZONE)
             
             return {
                 "last_activity": last_activity_dt.strftime("%Y-%m-%d %H:%M:%S"),
@@ -352,18 +459,30 @@ class DeviceStatusSensor(SensorEntity):
 class LastUpdateSensor(BaseWindSensor):
     """最后更新时间传感器"""
     
-    def __init__(self, hass: HomeAssistant, entry_id: str):
+    __slots__ = ('_formatted_second', '_formatted_time')
+    
+    def __init__(self, hass: HomeAssistant, entry_id: str, coordinator: WindCoordinator):
         super().__init__(
-            hass, entry_id, "最后更新", "Wind Last Update", "wind_last_update", "mdi:clock-outline"
+            hass, entry_id, coordinator, "最后更新", "Wind Last Update", "wind_last_update", "mdi:clock-outline"
         )
         self._attr_native_value = "从未更新"
         # 禁用历史记录
         self._attr_state_class = None
         self._attr_force_update = True
+        # 同一秒内复用已格式化的时间字符串
+        self._formatted_second: Optional[int] = None
+        self._formatted_time = ""
+        
+    def _apply_wind_data(self, wind_data: Dict[str, Any]) -> bool:
+        """应用更新时间"""
+        second = int(time.time())
+        if second != self._formatted_second:
+            # 使用Home Assistant的时区感知时间
+            self._formatted_time = dt_util.utc_from_timestamp(second).astimezone(
+                dt_util.DEFAULT_TIME_ZONE
+            ).strftime("%Y-%m-%d %H:%M:%S")
+            self._formatted_second = second
         
-    def _handle_wind_data(self, wind_data: Dict[str, Any]) -> None:
-        """处理更新时间"""
-        # 使用Home Assistant的时区感知时间
-        current_time = dt_util.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._update_state(current_time, f"数据更新时间: {current_time}")
+        current_time = self._formatted_time
+        return self._set_native_value(current_time, "数据更新时间: %s", current_time)
 